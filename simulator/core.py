@@ -10,21 +10,30 @@ from .execution_price_simulator import generate_sample_execution_prices, calcula
 import os
 import json
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 
-def generate_dataframe(excel_path, sheet_name=None):
+def generate_dataframe(excel_path, sheet_name=None, seed=None, trade_config=None):
+    """Build the simulated execution log for one ticker sheet.
+
+    ``trade_config`` overrides the ticker's trade synthesis settings
+    (see ``trade_generator.DEFAULT_TRADE_CONFIG``).
+    """
     if sheet_name is None:
         sheet_name = 0
+    # an integer sheet index is resolved to its sheet name, which is the ticker
+    ticker = sheet_name if isinstance(sheet_name, str) else pd.ExcelFile(excel_path).sheet_names[sheet_name]
+    rng = np.random.default_rng(seed)
     df_stock = load_stock_data(excel_path, sheet_name)
-    df_trades = generate_trade_metadata(df_stock)
+    df_trades = generate_trade_metadata(df_stock, ticker, trade_config, rng)
     
     # The following will update the trade directions based on technical indicators RSI & GoldenCrossover- 
     # based on heuristics to make it more realistic and less random
     # will create profits. the rationale being that real traders wil look at
     # technical indicators before placing trades.
     df_trades = apply_technical_indicators(df_trades)
-    df_trades = re_assign_trade_directions(df_trades, df_stock)
+    df_trades = re_assign_trade_directions(df_trades, ticker, trade_config, rng)
     df_trades.drop(columns=['RSI','MACD','MACD_Signal','GoldenCrossover'], inplace=True)
     
     # calculate volatility if not present
@@ -49,12 +58,12 @@ def generate_dataframe(excel_path, sheet_name=None):
     return df_trades
 
 
-def generate_dataset(excel_path, out_path, sheet_name=None, seed=None):
+def generate_dataset(excel_path, out_path, sheet_name=None, seed=None, trade_config=None):
     """Create dataset and write to Excel (.xlsx) at out_path. Also write metadata JSON alongside.
 
     Returns the path to the created Excel file.
     """
-    df = generate_dataframe(excel_path, sheet_name)
+    df = generate_dataframe(excel_path, sheet_name, seed, trade_config)
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
 
     # write to Excel
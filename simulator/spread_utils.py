@@ -8,6 +8,9 @@ trades based on trade direction, hour of day and order month.
 
 import pandas as pd
 import os
+from functools import lru_cache
+
+SPREAD_SHEETS = ('sell_low', 'sell_high', 'buy_low', 'buy_high')
 
 def build_matrix_dict(df):
     col_keys = df.columns[1:]
@@ -24,6 +27,15 @@ def build_matrix_dict(df):
     return matrix_dict
 
 
+@lru_cache(maxsize=None)
+def spread_matrix_hours():
+    """Return the hours of day present as rows in every spread-matrix sheet."""
+    file_path = os.path.join(os.path.dirname(__file__), "data", "Buy-Sell-Spread-Matrix.xlsx")
+    xls = pd.read_excel(file_path, sheet_name=list(SPREAD_SHEETS), engine='openpyxl')
+    hours = [set(int(h) for h in xls[name].iloc[:, 0].dropna()) for name in SPREAD_SHEETS]
+    return frozenset.intersection(*map(frozenset, hours))
+
+
 def get_buy_sell_spread(trade_direction, hour_of_day, order_month):
     base_dir = os.path.dirname(__file__)
     file_path = os.path.join(base_dir, "data", "Buy-Sell-Spread-Matrix.xlsx")
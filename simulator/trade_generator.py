@@ -4,9 +4,12 @@ simulator/trade_generator.py
 Generate synthetic trade metadata and compute technical indicators.
 """
 
+from numbers import Integral
+
 import pandas as pd
 import numpy as np
 import ta
+from .spread_utils import spread_matrix_hours
 
 
 def load_stock_data(filepath, sheet_name):
@@ -15,16 +18,84 @@ def load_stock_data(filepath, sheet_name):
     return df_stock_price
 
 
-def generate_trade_metadata(df_stock_price):
-    order_qty = np.random.randint(1000, 2001, size=len(df_stock_price))
-    trade_direction = np.random.choice(['LONG', 'SHORT'], size=len(df_stock_price), p=[0.65, 0.35])
-    execution_times = [f"{np.random.randint(9, 14):02d}:{np.random.randint(0, 59):02d}:{np.random.randint(0, 59):02d}" for _ in df_stock_price['Date']]
-    hour_of_day = [int(t.split(':')[0]) for t in execution_times]
+DEFAULT_TRADE_CONFIG = {
+    'qty_range': (1000, 2000),                       # inclusive OrderQty bounds
+    'direction_probs': {'LONG': 0.65, 'SHORT': 0.35},
+    'trading_hours': (9, 14),                        # [start, end) hours; each must be a spread-matrix row
+    'long_override_frac': 0.68,                      # share of bullish-signal bars forced LONG
+    'short_override_frac': 0.58,                     # share of bearish-signal bars forced SHORT
+}
+
+# Per-ticker overrides of DEFAULT_TRADE_CONFIG, e.g. {'RELIANCE': {'qty_range': (200, 800)}}
+TICKER_TRADE_CONFIG = {}
+
+
+def resolve_trade_config(ticker, config=None):
+    """Merge defaults, the ticker's entry in TICKER_TRADE_CONFIG and explicit overrides."""
+    cfg = dict(DEFAULT_TRADE_CONFIG)
+    cfg.update(TICKER_TRADE_CONFIG.get(ticker, {}))
+    cfg.update(config or {})
+
+    qty_low, qty_high = cfg['qty_range']
+    if not all(isinstance(q, Integral) and not isinstance(q, bool) for q in (qty_low, qty_high)):
+        raise ValueError(f"qty_range {cfg['qty_range']} for {ticker} must hold integers")
+    if not 0 < qty_low <= qty_high:
+        raise ValueError(f"Invalid qty_range {cfg['qty_range']} for {ticker}")
+    start_hour, end_hour = cfg['trading_hours']
+    if not 0 <= start_hour < end_hour <= 24:
+        raise ValueError(f"Invalid trading_hours {cfg['trading_hours']} for {ticker}")
+    missing_hours = sorted(set(range(start_hour, end_hour)) - spread_matrix_hours())
+    if missing_hours:
+        raise ValueError(
+            f"trading_hours {cfg['trading_hours']} for {ticker} include hours {missing_hours} "
+            f"not in the spread matrix (available: {sorted(spread_matrix_hours())})"
+        )
+    # label_intraday_trade and calculate_trade_metrics treat anything but 'LONG' as short
+    unknown = set(cfg['direction_probs']) - {'LONG', 'SHORT'}
+    if unknown:
+        raise ValueError(f"direction_probs for {ticker} has unknown directions {sorted(unknown)}; use 'LONG'/'SHORT'")
+    if any(p < 0 for p in cfg['direction_probs'].values()):
+        raise ValueError(f"direction_probs for {ticker} must be non-negative: {cfg['direction_probs']}")
+    if not np.isclose(sum(cfg['direction_probs'].values()), 1.0):
+        raise ValueError(f"direction_probs for {ticker} must sum to 1: {cfg['direction_probs']}")
+    for key in ('long_override_frac', 'short_override_frac'):
+        if not 0 <= cfg[key] <= 1:
+            raise ValueError(f"Invalid {key} {cfg[key]} for {ticker}; must be in [0, 1]")
+    return cfg
+
+
+def _format_seconds(seconds, start_second, end_second):
+    """Map second-of-day ints to 'HH:MM:SS' via a lookup table over the trading window."""
+    window = np.arange(start_second, end_second)
+    table = np.array([f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in window])
+    return table[seconds - start_second]
+
+
+def generate_trade_metadata(df_stock_price, ticker='HDFCBANK', config=None, rng=None):
+    """Synthesise one trade per price bar.
+
+    Execution times are drawn as integer seconds within the ticker's trading
+    hours, so HourOfDay is derived arithmetically rather than parsed back
+    from the formatted ExecutionTime string.
+    """
+    cfg = resolve_trade_config(ticker, config)
+    rng = np.random.default_rng(rng)
+    n = len(df_stock_price)
+
+    qty_low, qty_high = cfg['qty_range']
+    order_qty = rng.integers(qty_low, qty_high, size=n, endpoint=True)
+    directions = list(cfg['direction_probs'])
+    trade_direction = rng.choice(directions, size=n, p=[cfg['direction_probs'][d] for d in directions])
+
+    start_second, end_second = cfg['trading_hours'][0] * 3600, cfg['trading_hours'][1] * 3600
+    execution_seconds = rng.integers(start_second, end_second, size=n)
+    hour_of_day = execution_seconds // 3600
+    execution_times = _format_seconds(execution_seconds, start_second, end_second)
     order_month = pd.to_datetime(df_stock_price['Date']).dt.month
 
     df_trades = pd.DataFrame({
-        'TradeId': range(1, len(df_stock_price)+1),
-        'Ticker': ['HDFCBANK'] * len(df_stock_price),
+        'TradeId': np.arange(1, n + 1),
+        'Ticker': ticker,
         'ExecutionDate': df_stock_price['Date'],
         'Open': df_stock_price['Open'],
         'High': df_stock_price['High'],
@@ -36,26 +107,26 @@ def generate_trade_metadata(df_stock_price):
         'OrderMonth': order_month,
         'OrderQty': order_qty,
         'TradeDirection': trade_direction,
-        'OrderSubType': ['MARKET'] * len(df_stock_price),
-        'Exchange': ['NSE'] * len(df_stock_price),
-        'Broker': ['ICICI'] * len(df_stock_price),
-        'OrderStatus': ['Fulfilled'] * len(df_stock_price),
+        'OrderSubType': 'MARKET',
+        'Exchange': 'NSE',
+        'Broker': 'ICICI',
+        'OrderStatus': 'Fulfilled',
         'ExecutionTime': execution_times,
         'HourOfDay': hour_of_day,
         'ExecutedQty': order_qty,
-        'AvgEntryExecutionPrice': [None] * len(df_stock_price),
-        'AvgExitExecutionPrice': [None] * len(df_stock_price),
-        'TotalEntryTradeValue': [None] * len(df_stock_price),
-        'TotalExitTradeValue': [None] * len(df_stock_price),
-        'EntryBrokerage': [None] * len(df_stock_price),
-        'ExitBrokerage': [None] * len(df_stock_price),
-        'NetEntryAmount': [None] * len(df_stock_price),
-        'NetExitAmount': [None] * len(df_stock_price),
-        'TotalTradeSlippageCost': [None] * len(df_stock_price),
-        'ProfitLoss': [None] * len(df_stock_price),
-        'ClientDematId': ['123'] * len(df_stock_price)
-    })
-    
+        'AvgEntryExecutionPrice': None,
+        'AvgExitExecutionPrice': None,
+        'TotalEntryTradeValue': None,
+        'TotalExitTradeValue': None,
+        'EntryBrokerage': None,
+        'ExitBrokerage': None,
+        'NetEntryAmount': None,
+        'NetExitAmount': None,
+        'TotalTradeSlippageCost': None,
+        'ProfitLoss': None,
+        'ClientDematId': '123'
+    }, index=df_stock_price.index)
+
     return df_trades
 
 
@@ -68,20 +139,34 @@ def apply_technical_indicators(df_trades):
     return df_trades
 
 
-def re_assign_trade_directions(df_trades, df_stock_price):
-    goldencrossover_oversold_indices = df_trades[(df_trades['GoldenCrossover']==1) | (df_trades['RSI']<30)].index
-    num_long = int(0.68 * len(goldencrossover_oversold_indices))
-    long_indices = np.random.choice(goldencrossover_oversold_indices, size=num_long, replace=False) if len(goldencrossover_oversold_indices)>0 else []
-    df_trades.loc[long_indices, 'TradeDirection'] = "LONG"
-    df_trades.loc[long_indices, 'ExitPrice'] = df_stock_price.loc[long_indices, 'High']
-    df_trades.loc[long_indices, 'EntryPrice'] = df_stock_price.loc[long_indices, 'Low']
+def _pick(candidates, frac, rng):
+    """Boolean mask selecting exactly int(frac * candidates.sum()) of the candidate rows."""
+    picked = np.zeros(len(candidates), dtype=bool)
+    idx = np.flatnonzero(candidates)
+    picked[rng.choice(idx, size=int(frac * len(idx)), replace=False)] = True
+    return picked
 
-    bearcrossover_overbought_indices = df_trades[(df_trades['GoldenCrossover']==0) | (df_trades['RSI']>70)].index
-    num_short = int(0.58 * len(bearcrossover_overbought_indices))
-    short_indices = np.random.choice(bearcrossover_overbought_indices, size=num_short, replace=False) if len(bearcrossover_overbought_indices)>0 else []
-    df_trades.loc[short_indices, 'TradeDirection'] = "SHORT"
-    df_trades.loc[short_indices, 'ExitPrice'] = df_stock_price.loc[short_indices, 'Low']
-    df_trades.loc[short_indices, 'EntryPrice'] = df_stock_price.loc[short_indices, 'High']
 
-    return df_trades
+def re_assign_trade_directions(df_trades, ticker='HDFCBANK', config=None, rng=None):
+    """Bias trade directions towards RSI / MACD-crossover signals.
 
+    A share of bullish bars (golden crossover or RSI < 30) become LONG trades
+    entering at the Low and exiting at the High; a share of bearish bars
+    (no crossover or RSI > 70) become SHORT trades entering at the High and
+    exiting at the Low. SHORT wins where both are picked.
+    """
+    cfg = resolve_trade_config(ticker, config)
+    rng = np.random.default_rng(rng)
+
+    crossover = df_trades['GoldenCrossover'].to_numpy()
+    rsi = df_trades['RSI'].to_numpy()
+    is_long = _pick((crossover == 1) | (rsi < 30), cfg['long_override_frac'], rng)
+    is_short = _pick((crossover == 0) | (rsi > 70), cfg['short_override_frac'], rng)
+
+    high = df_trades['High'].to_numpy()
+    low = df_trades['Low'].to_numpy()
+    df_trades['TradeDirection'] = np.where(is_short, 'SHORT', np.where(is_long, 'LONG', df_trades['TradeDirection'].to_numpy()))
+    df_trades['EntryPrice'] = np.where(is_short, high, np.where(is_long, low, df_trades['EntryPrice'].to_numpy()))
+    df_trades['ExitPrice'] = np.where(is_short, low, np.where(is_long, high, df_trades['ExitPrice'].to_numpy()))
+
+    return df_trades
@@ -0,0 +1,88 @@
+"""Round-trip smoke tests for trainer/artifacts.py."""
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('sklearn')
+pytest.importorskip('tensorflow')
+
+from trainer.artifacts import ModelRegistry, hash_dataset, load_bundle, save_bundle
+from trainer.lstm_model import build_lstm_model
+from trainer.train_model import fit_scalers
+
+PRICE = ['p1', 'p2']
+INDICATORS = ['i1', 'i2', 'i3']
+TIME = ['t1']
+SEQUENCE_LENGTH = 4
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(50, 6)) * 10, columns=PRICE + INDICATORS + TIME)
+
+
+@pytest.fixture
+def fitted(df):
+    model = build_lstm_model(SEQUENCE_LENGTH, len(PRICE), len(INDICATORS), len(TIME))
+    scalers = fit_scalers(df, PRICE, INDICATORS, TIME)
+    return model, scalers
+
+
+def _save(fitted, df, registry_dir):
+    model, scalers = fitted
+    return save_bundle(model, scalers, PRICE, INDICATORS, TIME, SEQUENCE_LENGTH,
+                       hash_dataset(df), registry_dir=str(registry_dir))
+
+
+def test_round_trip_weights_and_scaling(fitted, df, tmp_path):
+    digest = _save(fitted, df, tmp_path)
+    bundle = load_bundle(str(tmp_path / digest))
+
+    for saved, loaded in zip(fitted[0].get_weights(), bundle.model.get_weights()):
+        np.testing.assert_array_equal(saved, loaded)
+
+    scalers = fitted[1]
+    Xp, Xi, Xt = bundle.scale(df)
+    np.testing.assert_allclose(Xp, scalers['price'].transform(df[PRICE]))
+    np.testing.assert_allclose(Xi, scalers['indicators'].transform(df[INDICATORS]))
+    np.testing.assert_allclose(Xt, scalers['time'].transform(df[TIME]))
+    assert bundle.sequence_length == SEQUENCE_LENGTH
+    assert bundle.price_features == PRICE
+
+
+def test_saving_twice_returns_same_digest(fitted, df, tmp_path):
+    assert _save(fitted, df, tmp_path) == _save(fitted, df, tmp_path)
+    assert ModelRegistry(str(tmp_path)).list_digests() == [_save(fitted, df, tmp_path)]
+
+
+def test_bad_schema_version_rejected(fitted, df, tmp_path):
+    bundle_dir = tmp_path / _save(fitted, df, tmp_path)
+    manifest = json.loads((bundle_dir / 'manifest.json').read_text())
+    manifest['schema_version'] = 999
+    (bundle_dir / 'manifest.json').write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match='schema_version'):
+        load_bundle(str(bundle_dir))
+
+
+def test_tampered_weights_rejected(fitted, df, tmp_path):
+    bundle_dir = tmp_path / _save(fitted, df, tmp_path)
+    path = bundle_dir / 'weights' / 'w_000.npy'
+    w = np.load(path)
+    np.save(path, w + 1)
+    with pytest.raises(ValueError, match='digest'):
+        load_bundle(str(bundle_dir))
+    load_bundle(str(bundle_dir), verify=False)
+
+
+def test_registry_ignores_temp_dirs(fitted, df, tmp_path):
+    digest = _save(fitted, df, tmp_path)
+    stale = tmp_path / '.bundle-abc123'
+    stale.mkdir()
+    (stale / 'manifest.json').write_text('{}')
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.list_digests() == [digest]
+    assert registry.load(digest[:8]) is registry.load(digest)
@@ -0,0 +1,95 @@
+"""Checks for the vectorised trade-synthesis stage in simulator/trade_generator.py."""
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('ta')
+pytest.importorskip('openpyxl')
+
+import simulator.core as core
+from simulator.trade_generator import DEFAULT_TRADE_CONFIG, generate_trade_metadata, re_assign_trade_directions
+
+
+def _stock(n=80, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1000 + rng.normal(size=n).cumsum() * 5
+    open_ = close + rng.normal(size=n)
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=n, freq='B'),
+        'Open': open_,
+        'High': np.maximum(open_, close) + 5,
+        'Low': np.minimum(open_, close) - 5,
+        'Close': close,
+        'Volume': rng.integers(100_000, 1_000_000, size=n),
+    })
+
+
+def _signal_trades(crossover, rsi):
+    n = len(crossover)
+    return pd.DataFrame({
+        'GoldenCrossover': crossover,
+        'RSI': rsi,
+        'TradeDirection': ['LONG'] * n,
+        'Open': np.full(n, 100.0),
+        'High': np.full(n, 110.0),
+        'Low': np.full(n, 90.0),
+        'EntryPrice': np.full(n, 100.0),
+        'ExitPrice': np.full(n, 101.0),
+    })
+
+
+def test_same_seed_gives_identical_frame(monkeypatch):
+    monkeypatch.setattr(core, 'load_stock_data', lambda path, sheet: _stock())
+    first = core.generate_dataframe('unused.xlsx', 'HDFCBANK', seed=7)
+    second = core.generate_dataframe('unused.xlsx', 'HDFCBANK', seed=7)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_integer_sheet_index_resolves_ticker(monkeypatch):
+    monkeypatch.setattr(core, 'load_stock_data', lambda path, sheet: _stock())
+    excel_path = os.path.join(os.path.dirname(core.__file__), 'data', 'NiftyPriceHistory.xlsx')
+    df = core.generate_dataframe(excel_path, 3, seed=7)
+    assert (df['Ticker'] == 'TCS').all()
+
+
+def test_hour_of_day_matches_execution_time():
+    df = generate_trade_metadata(_stock(5000), rng=1)
+    start, end = DEFAULT_TRADE_CONFIG['trading_hours']
+    parsed = df['ExecutionTime'].str.slice(0, 2).astype(int)
+    assert (parsed == df['HourOfDay']).all()
+    assert df['HourOfDay'].between(start, end - 1).all()
+
+
+def test_short_wins_where_both_masks_pick():
+    n = 40
+    df = _signal_trades(np.ones(n, dtype=int), np.full(n, 80.0))  # crossover and overbought
+    config = {'long_override_frac': 1.0, 'short_override_frac': 1.0}
+    df = re_assign_trade_directions(df, config=config, rng=0)
+    assert (df['TradeDirection'] == 'SHORT').all()
+    assert (df['EntryPrice'] == df['High']).all()
+    assert (df['ExitPrice'] == df['Low']).all()
+
+
+def test_override_counts_are_exact():
+    n_long, n_short = 57, 43
+    crossover = np.r_[np.ones(n_long, dtype=int), np.zeros(n_short, dtype=int)]
+    df = _signal_trades(crossover, np.full(n_long + n_short, 50.0))  # disjoint candidate sets
+    df = re_assign_trade_directions(df, rng=3)
+    assert (df['EntryPrice'] == df['Low']).sum() == int(DEFAULT_TRADE_CONFIG['long_override_frac'] * n_long)
+    assert (df['EntryPrice'] == df['High']).sum() == int(DEFAULT_TRADE_CONFIG['short_override_frac'] * n_short)
+    assert (df.loc[df['EntryPrice'] == df['High'], 'TradeDirection'] == 'SHORT').all()
+
+
+@pytest.mark.parametrize('config', [
+    {'direction_probs': {'BUY': 0.6, 'SELL': 0.4}},
+    {'direction_probs': {'LONG': 1.2, 'SHORT': -0.2}},
+    {'trading_hours': (6, 10)},
+    {'long_override_frac': 1.5},
+    {'short_override_frac': -0.1},
+    {'qty_range': (1000.5, 2000)},
+])
+def test_invalid_config_rejected(config):
+    with pytest.raises(ValueError, match='HDFCBANK'):
+        generate_trade_metadata(_stock(10), 'HDFCBANK', config)
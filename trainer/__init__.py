@@ -6,6 +6,7 @@ at package import time. Consumers should import symbols from submodules, e.g.
 
 from trainer.pipeline import LSTMModelTrainer
 from trainer.train_model import prepare_sequences, train_model
+from trainer.artifacts import ModelRegistry, load_bundle
 
 """
 
@@ -14,6 +15,7 @@ __all__ = [
     'train_model',
     'lstm_model',
     'evaluate_model',
+    'artifacts',
 ]
 
 
@@ -0,0 +1,326 @@
+"""
+trainer/artifacts.py
+
+Versioned model artifact bundles and a content-addressed registry.
+
+A bundle is a directory holding everything needed to score with a trained
+model:
+
+    manifest.json          schema version, feature lists, sequence length,
+                           label scheme, dataset hash, array index
+    model.json             Keras architecture (model.to_json())
+    weights/w_000.npy ...  model weights, one plain .npy per tensor
+    scalers/<name>.npy     MinMaxScaler parameters (min_, scale_) as arrays
+
+Bundles live under a registry root in a directory named after the sha256
+digest of their content, so many versions can be kept side by side and a
+digest always identifies exactly one model.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_VERSION = 1
+DEFAULT_REGISTRY_DIR = 'model/registry'
+DEFAULT_LABEL_SCHEME = {0: 'No Action', 1: 'Long Buy', 2: 'Short Sell'}
+
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+SCALER_GROUPS = ('price', 'indicators', 'time')
+_FEATURE_KEYS = {'price': 'price_features', 'indicators': 'indicator_features', 'time': 'time_features'}
+_REQUIRED_KEYS = (
+    'schema_version', 'digest', 'price_features', 'indicator_features', 'time_features',
+    'sequence_length', 'label_scheme', 'dataset_hash', 'weights', 'scalers',
+)
+
+
+def hash_dataset(df, columns=None):
+    """Return a sha256 hex digest of the (optionally column-restricted) DataFrame content."""
+    if columns is not None:
+        df = df[list(columns)]
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    h = hashlib.sha256(row_hashes.tobytes())
+    h.update(json.dumps([str(c) for c in df.columns]).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _scaler_arrays(scaler):
+    """Extract the MinMaxScaler parameters needed for transform as plain float arrays."""
+    return {
+        'min': np.asarray(scaler.min_, dtype=np.float64),
+        'scale': np.asarray(scaler.scale_, dtype=np.float64),
+    }
+
+
+def _compute_digest(architecture, weights, scalers, manifest):
+    """sha256 over architecture, weight bytes, scaler bytes and the manifest minus digest/created_at.
+
+    ``scalers`` maps group -> {'min': arr, 'scale': arr}; groups are hashed in
+    SCALER_GROUPS order so save and load agree regardless of dict order.
+    """
+    h = hashlib.sha256()
+    h.update(architecture.encode('utf-8'))
+    for w in weights:
+        h.update(np.ascontiguousarray(w).tobytes())
+    for group in SCALER_GROUPS:
+        for name in ('min', 'scale'):
+            h.update(np.ascontiguousarray(scalers[group][name]).tobytes())
+    core = {k: v for k, v in manifest.items() if k not in ('digest', 'created_at')}
+    h.update(json.dumps(core, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _array_entry(rel_path, arr):
+    return {'path': rel_path, 'shape': list(arr.shape), 'dtype': str(arr.dtype)}
+
+
+def save_bundle(model, scalers, price_features, indicator_features, time_features,
+                sequence_length, dataset_hash, label_scheme=None, registry_dir=DEFAULT_REGISTRY_DIR):
+    """Write a bundle into ``registry_dir`` and return its digest.
+
+    ``scalers`` maps each of ``SCALER_GROUPS`` to a fitted MinMaxScaler.
+    Saving identical content twice is a no-op that returns the same digest.
+    """
+    if label_scheme is None:
+        label_scheme = DEFAULT_LABEL_SCHEME
+    missing = [g for g in SCALER_GROUPS if g not in scalers]
+    if missing:
+        raise ValueError(f'Missing scalers for: {missing}')
+
+    os.makedirs(registry_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.bundle-', dir=registry_dir)
+    try:
+        os.makedirs(os.path.join(tmp_dir, 'weights'))
+        os.makedirs(os.path.join(tmp_dir, 'scalers'))
+
+        architecture = model.to_json()
+        with open(os.path.join(tmp_dir, 'model.json'), 'w', encoding='utf-8') as f:
+            f.write(architecture)
+
+        weights = [np.ascontiguousarray(w) for w in model.get_weights()]
+        weight_entries = []
+        for i, w in enumerate(weights):
+            rel_path = f'weights/w_{i:03d}.npy'
+            np.save(os.path.join(tmp_dir, rel_path), w)
+            weight_entries.append(_array_entry(rel_path, w))
+
+        scaler_arrays = {group: _scaler_arrays(scalers[group]) for group in SCALER_GROUPS}
+        scaler_entries = {}
+        for group, params in scaler_arrays.items():
+            scaler_entries[group] = {}
+            for name, arr in params.items():
+                rel_path = f'scalers/{group}_{name}.npy'
+                np.save(os.path.join(tmp_dir, rel_path), arr)
+                scaler_entries[group][name] = _array_entry(rel_path, arr)
+
+        manifest = {
+            'schema_version': SCHEMA_VERSION,
+            'price_features': list(price_features),
+            'indicator_features': list(indicator_features),
+            'time_features': list(time_features),
+            'sequence_length': int(sequence_length),
+            'label_scheme': {str(k): v for k, v in label_scheme.items()},
+            'dataset_hash': dataset_hash,
+            'weights': weight_entries,
+            'scalers': scaler_entries,
+        }
+        # created_at is excluded from the digest so identical content maps to one bundle
+        digest = _compute_digest(architecture, weights, scaler_arrays, manifest)
+        manifest['digest'] = digest
+        manifest['created_at'] = datetime.utcnow().isoformat() + 'Z'
+        with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        final_dir = os.path.join(registry_dir, digest)
+        if os.path.isdir(final_dir):
+            shutil.rmtree(tmp_dir)
+        else:
+            try:
+                os.replace(tmp_dir, final_dir)
+            except OSError:
+                # A concurrent save of the same content won the rename; that bundle is identical
+                if not os.path.isdir(final_dir):
+                    raise
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return digest
+
+
+def _validate_manifest(manifest, bundle_dir):
+    missing = [k for k in _REQUIRED_KEYS if k not in manifest]
+    if missing:
+        raise ValueError(f'Bundle manifest in {bundle_dir} is missing keys: {missing}')
+    if manifest['schema_version'] != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported bundle schema_version {manifest['schema_version']} (expected {SCHEMA_VERSION})"
+        )
+    if os.path.basename(os.path.normpath(bundle_dir)) != manifest['digest']:
+        raise ValueError(f"Bundle directory {bundle_dir} does not match manifest digest {manifest['digest']}")
+    if int(manifest['sequence_length']) <= 0:
+        raise ValueError('sequence_length must be positive')
+    for group in SCALER_GROUPS:
+        n_features = len(manifest[_FEATURE_KEYS[group]])
+        params = manifest['scalers'].get(group)
+        if params is None or set(params) != {'min', 'scale'}:
+            raise ValueError(f'Bundle scaler parameters for {group!r} are incomplete')
+        for name, entry in params.items():
+            if entry['shape'] != [n_features]:
+                raise ValueError(
+                    f'Scaler {group}.{name} has shape {entry["shape"]}, expected [{n_features}]'
+                )
+
+
+def _load_array(bundle_dir, entry, mmap_mode):
+    arr = np.load(os.path.join(bundle_dir, entry['path']), mmap_mode=mmap_mode, allow_pickle=False)
+    if list(arr.shape) != entry['shape'] or str(arr.dtype) != entry['dtype']:
+        raise ValueError(
+            f"Array {entry['path']} is {arr.dtype}{list(arr.shape)}, "
+            f"manifest says {entry['dtype']}{entry['shape']}"
+        )
+    return arr
+
+
+class ModelBundle:
+    """A loaded bundle: Keras model, scaler parameters and training configuration."""
+
+    def __init__(self, bundle_dir, manifest, model, scalers):
+        self.bundle_dir = bundle_dir
+        self.manifest = manifest
+        self.model = model
+        self.scalers = scalers
+
+    @property
+    def digest(self):
+        return self.manifest['digest']
+
+    @property
+    def sequence_length(self):
+        return self.manifest['sequence_length']
+
+    @property
+    def price_features(self):
+        return self.manifest['price_features']
+
+    @property
+    def indicator_features(self):
+        return self.manifest['indicator_features']
+
+    @property
+    def time_features(self):
+        return self.manifest['time_features']
+
+    @property
+    def label_scheme(self):
+        return {int(k): v for k, v in self.manifest['label_scheme'].items()}
+
+    def scale(self, df):
+        """Apply the stored MinMax scaling and return (X_price, X_indicators, X_time)."""
+        out = []
+        for group in SCALER_GROUPS:
+            params = self.scalers[group]
+            X = df[self.manifest[_FEATURE_KEYS[group]]].to_numpy(dtype=np.float64)
+            out.append(X * params['scale'] + params['min'])
+        return tuple(out)
+
+
+def load_bundle(bundle_dir, mmap=True, verify=True):
+    """Load and validate a bundle directory.
+
+    With ``mmap`` True the weight files are opened memory-mapped, which only
+    makes reading lazy: ``set_weights`` still copies every tensor into the
+    model's variables, so resident memory is the same as a plain load.
+    With ``verify`` True the content digest is recomputed from the files and
+    a mismatch with the manifest raises ValueError.
+    """
+    manifest_path = os.path.join(bundle_dir, 'manifest.json')
+    if not os.path.isfile(manifest_path):
+        raise FileNotFoundError(f'No manifest.json in {bundle_dir}')
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    _validate_manifest(manifest, bundle_dir)
+
+    mmap_mode = 'r' if mmap else None
+    weights = [_load_array(bundle_dir, entry, mmap_mode) for entry in manifest['weights']]
+    scalers = {
+        group: {name: _load_array(bundle_dir, entry, None) for name, entry in params.items()}
+        for group, params in manifest['scalers'].items()
+    }
+
+    with open(os.path.join(bundle_dir, 'model.json'), encoding='utf-8') as f:
+        architecture = f.read()
+    if verify and _compute_digest(architecture, weights, scalers, manifest) != manifest['digest']:
+        raise ValueError(f'Bundle {bundle_dir} content does not match its digest (corrupted or edited)')
+
+    # Local import so manifests can be inspected without pulling in TensorFlow
+    from keras.models import model_from_json
+    model = model_from_json(architecture)
+    if len(weights) != len(model.weights):
+        raise ValueError(f'Bundle has {len(weights)} weight arrays, model expects {len(model.weights)}')
+    model.set_weights(weights)
+
+    return ModelBundle(bundle_dir, manifest, model, scalers)
+
+
+class ModelRegistry:
+    """Content-addressed store of bundles with an in-process cache of loaded models.
+
+    Usage:
+        registry = ModelRegistry('model/registry')
+        digest = registry.save(trainer.model, trainer.scalers, ...)
+        bundle = registry.load(digest)   # warm on subsequent calls
+    """
+
+    def __init__(self, root=DEFAULT_REGISTRY_DIR, mmap=True, verify=True):
+        self.root = root
+        self.mmap = mmap
+        self.verify = verify
+        self._loaded = {}
+
+    def save(self, model, scalers, price_features, indicator_features, time_features,
+             sequence_length, dataset_hash, label_scheme=None):
+        return save_bundle(model, scalers, price_features, indicator_features, time_features,
+                           sequence_length, dataset_hash, label_scheme=label_scheme, registry_dir=self.root)
+
+    def list_digests(self):
+        if not os.path.isdir(self.root):
+            return []
+        # Only sha256-named directories; skips .bundle-* temp dirs left by an interrupted save
+        return sorted(
+            d for d in os.listdir(self.root)
+            if _DIGEST_RE.match(d) and os.path.isfile(os.path.join(self.root, d, 'manifest.json'))
+        )
+
+    def resolve(self, prefix):
+        """Return the full digest for a unique digest prefix."""
+        matches = [d for d in self.list_digests() if d.startswith(prefix)]
+        if not matches:
+            raise KeyError(f'No bundle matching {prefix!r} in {self.root}')
+        if len(matches) > 1:
+            raise KeyError(f'Digest prefix {prefix!r} is ambiguous: {matches}')
+        return matches[0]
+
+    def load(self, digest):
+        digest = self.resolve(digest)
+        bundle = self._loaded.get(digest)
+        if bundle is None:
+            bundle = load_bundle(os.path.join(self.root, digest), mmap=self.mmap, verify=self.verify)
+            self._loaded[digest] = bundle
+        return bundle
+
+    def warm(self, digests=None):
+        """Load every bundle (or the given digests) into the cache and return them."""
+        if digests is None:
+            digests = self.list_digests()
+        return [self.load(d) for d in digests]
+
+    def evict(self, digest):
+        self._loaded.pop(self.resolve(digest), None)
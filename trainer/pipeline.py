@@ -3,9 +3,10 @@
 Trainer pipeline that encapsulates preprocessing, training and saving.
 """
 from typing import Optional, Dict
-from trainer.train_model import prepare_sequences, compute_class_weights, train_model
+from trainer.train_model import fit_scalers, save_scalers, prepare_sequences, compute_class_weights, train_model
 from trainer.lstm_model import build_lstm_model
 from trainer.evaluate_model import evaluate_model
+from trainer.artifacts import DEFAULT_REGISTRY_DIR, hash_dataset, save_bundle
 import tensorflow as tf
 
 
@@ -16,10 +17,19 @@ class LSTMModelTrainer:
         self.sequence_length = sequence_length
         #self.model: Optional[tf.keras.Model] = None
         self.model = None
+        self.scalers = None
+        self.features = None
+        self.dataset_hash = None
 
     def preprocess(self, df, price_features, indicator_features, time_features):
-        """Scale and build sequences. Scalers are saved by prepare_sequences."""
-        return prepare_sequences(df, price_features, indicator_features, time_features, self.sequence_length)
+        """Scale and build sequences. Scalers and feature lists are kept for save_bundle."""
+        self.scalers = fit_scalers(df, price_features, indicator_features, time_features)
+        self.features = (list(price_features), list(indicator_features), list(time_features))
+        self.dataset_hash = hash_dataset(
+            df, [*price_features, *indicator_features, *time_features, 'IntradayTradeIndicator']
+        )
+        return prepare_sequences(df, price_features, indicator_features, time_features, self.sequence_length,
+                                 scalers=self.scalers, scaler_dir=None)
 
     def build_model(self, price_dim: int, indicator_dim: int, time_dim: int):
         self.model = build_lstm_model(self.sequence_length, price_dim, indicator_dim, time_dim)
@@ -44,10 +54,23 @@ class LSTMModelTrainer:
             raise RuntimeError('Model not available for evaluation.')
         evaluate_model(self.model, Xp_val, Xi_val, Xt_val, y_val)
 
-    def save(self, path='model/daytrading_breakout_model.keras'):
+    def save(self, path='model/daytrading_breakout_model.keras', scaler_dir='scalers'):
+        """Save the model and the scalers it was trained with, so the two stay a matching pair."""
         if self.model is None:
             raise RuntimeError('No model to save.')
         self.model.save(path)
+        if self.scalers is not None and scaler_dir is not None:
+            save_scalers(self.scalers, scaler_dir)
         return path
 
+    def save_bundle(self, registry_dir=DEFAULT_REGISTRY_DIR, label_scheme=None):
+        """Write a versioned artifact bundle to the registry and return its digest."""
+        if self.model is None:
+            raise RuntimeError('No model to save.')
+        if self.scalers is None:
+            raise RuntimeError('No scalers fitted. Call preprocess first.')
+        price_features, indicator_features, time_features = self.features
+        return save_bundle(self.model, self.scalers, price_features, indicator_features, time_features,
+                           self.sequence_length, self.dataset_hash, label_scheme=label_scheme,
+                           registry_dir=registry_dir)
 
@@ -37,4 +37,6 @@ def train_from_file(path, sequence_length=9):
     trainer.evaluate(Xp[-val_size:], Xi[-val_size:], Xt[-val_size:], y[-val_size:])
 
     trainer.save()
+    digest = trainer.save_bundle()
+    print(f'Model bundle saved to registry as {digest}')
     return True
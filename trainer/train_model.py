@@ -13,19 +13,39 @@ from tensorflow.keras.callbacks import EarlyStopping, LearningRateScheduler
 import os
 
 
-def prepare_sequences(df, price_features, indicator_features, time_features, sequence_length):
-    scaler_price = MinMaxScaler()
-    scaler_indicators = MinMaxScaler()
-    scaler_time = MinMaxScaler()
-
-    X_price = scaler_price.fit_transform(df[price_features])
-    X_indicators = scaler_indicators.fit_transform(df[indicator_features])
-    X_time = scaler_time.fit_transform(df[time_features])
-
-    os.makedirs('scalers', exist_ok=True)
-    joblib.dump(scaler_price, "scalers/scaler_price.pkl")
-    joblib.dump(scaler_indicators, "scalers/scaler_indicators.pkl")
-    joblib.dump(scaler_time, "scalers/scaler_time.pkl")
+def fit_scalers(df, price_features, indicator_features, time_features):
+    """Fit one MinMaxScaler per feature group, keyed by 'price', 'indicators', 'time'."""
+    return {
+        'price': MinMaxScaler().fit(df[price_features]),
+        'indicators': MinMaxScaler().fit(df[indicator_features]),
+        'time': MinMaxScaler().fit(df[time_features]),
+    }
+
+
+def save_scalers(scalers, scaler_dir='scalers'):
+    """Write the legacy scaler_{price,indicators,time}.pkl files."""
+    os.makedirs(scaler_dir, exist_ok=True)
+    joblib.dump(scalers['price'], os.path.join(scaler_dir, "scaler_price.pkl"))
+    joblib.dump(scalers['indicators'], os.path.join(scaler_dir, "scaler_indicators.pkl"))
+    joblib.dump(scalers['time'], os.path.join(scaler_dir, "scaler_time.pkl"))
+
+
+def prepare_sequences(df, price_features, indicator_features, time_features, sequence_length,
+                      scalers=None, scaler_dir='scalers'):
+    """Scale features and build LSTM sequences.
+
+    Pass pre-fitted ``scalers`` (see ``fit_scalers``) to reuse them; set
+    ``scaler_dir=None`` to skip writing the legacy ``*.pkl`` files.
+    """
+    if scalers is None:
+        scalers = fit_scalers(df, price_features, indicator_features, time_features)
+
+    X_price = scalers['price'].transform(df[price_features])
+    X_indicators = scalers['indicators'].transform(df[indicator_features])
+    X_time = scalers['time'].transform(df[time_features])
+
+    if scaler_dir is not None:
+        save_scalers(scalers, scaler_dir)
 
     Xp, Xi, Xt, y = [], [], [], []
     for i in range(len(df) - sequence_length):